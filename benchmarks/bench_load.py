@@ -0,0 +1,54 @@
+"""
+Сравнение времени загрузки большого хранилища вакансий в одном процессе и параллельно.
+
+Запуск: python -m benchmarks.bench_load [количество вакансий] [количество процессов]
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+from src.parallel_loader import CSV_FIELDNAMES, load_csv, load_jsonl
+from src.vacancy import Vacancy
+
+
+def make_vacancies(count: int) -> List[Vacancy]:
+    return [
+        Vacancy(f"Python Developer {i}", f"https://hh.ru/vacancy/{i}", 50000 + i % 200000,
+                f"Опыт с Django и Flask, проект {i}.\nУдалённая работа" if i % 5 == 0 else f"Описание {i}")
+        for i in range(count)
+    ]
+
+
+def timed(func: Callable[[], List[Vacancy]]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    vacancies = make_vacancies(count)
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "vacancies.csv")
+        jsonl_path = os.path.join(tmp, "vacancies.jsonl")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(v.as_dict() for v in vacancies)
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(v.as_dict(), ensure_ascii=False) + "\n" for v in vacancies)
+        print(f"Вакансий: {count}, процессов: {workers}")
+        for name, loader, path in (("CSV", load_csv, csv_path), ("JSONL", load_jsonl, jsonl_path)):
+            sequential = timed(lambda: loader(path, workers=1))
+            parallel = timed(lambda: loader(path, workers=workers, min_size=0))
+            print(f"{name:<6} один процесс: {sequential:.2f} с, параллельно: {parallel:.2f} с, "
+                  f"ускорение: {sequential / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
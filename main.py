@@ -1,17 +1,28 @@
 import logging
 import os
+from itertools import chain
 from dotenv import load_dotenv
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Optional
 
 from src.api import HeadHunterAPI
-from src.config import LOG_LEVEL, VACANCY_FILE, DEFAULT_PER_PAGE
-from src.file_saver import JSONSaver, VacancyFileSaver
-from src.csv_saver import CSVSaver
+from src.config import (
+    DEFAULT_PER_PAGE,
+    DESCRIPTION_LIMIT,
+    LOG_LEVEL,
+    NEAR_DUPLICATES,
+    PAGE_SIZE,
+    PARALLEL_LOAD,
+    VACANCY_FILE,
+)
+from src.dedup import NearDuplicateIndex
+from src.file_saver import CSVSaver, JSONSaver, VacancyFileSaver
+from src.query import And, Currency, Domain, Keyword, Predicate, Query, SalaryRange, VacancyIndex
 from src.utils import (
-    filter_vacancies,
     get_top_vacancies,
-    get_vacancies_by_salary,
+    iter_filter_vacancies,
+    iter_vacancies_by_salary,
     print_vacancies,
+    print_vacancies_paged,
     sort_vacancies,
 )
 from src.vacancy import Vacancy
@@ -23,26 +34,134 @@ load_dotenv()
 
 class VacancySaver:
     """
-    Универсальный класс для сохранения вакансий в JSON или CSV в зависимости от расширения файла.
+    Универсальный класс для сохранения вакансий в JSON, JSONL или CSV в зависимости от расширения файла.
     """
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, parallel: bool = False, near_duplicates: bool = False) -> None:
         self.filename = filename.lower()
+        self.near_duplicates = near_duplicates
+        self.__duplicates_index: Optional[NearDuplicateIndex] = None
         self.saver: VacancyFileSaver  # объявляем тип один раз
-        if self.filename.endswith('.json'):
-            self.saver = JSONSaver(filename)
+        if self.filename.endswith(('.json', '.jsonl')):
+            self.saver = JSONSaver(filename, parallel=parallel)
         elif self.filename.endswith('.csv'):
-            self.saver = CSVSaver(filename)
+            self.saver = CSVSaver(filename, parallel=parallel)
         else:
-            raise ValueError("Поддерживаются только файлы с расширением .json или .csv")
+            raise ValueError("Поддерживаются только файлы с расширением .json, .jsonl или .csv")
 
-    def add_vacancy(self, vacancy: Vacancy) -> None:
-        self.saver.add_vacancy(vacancy)
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """
+        Сохраняет вакансию. При near_duplicates=True почти одинаковые вакансии
+        (перепубликации с другой ссылкой или слегка изменённым названием) пропускаются.
+        Возвращает True, если вакансия записана в файл.
+        """
+        if self.near_duplicates:
+            if self.__duplicates_index is None:
+                self.__duplicates_index = NearDuplicateIndex(self.saver.iter_vacancies())
+            if self.__duplicates_index.find_duplicate(vacancy) is not None:
+                logger.info(f"Пропущен почти дубликат вакансии: {vacancy.title} ({vacancy.url})")
+                return False
+        if not self.saver.add_vacancy(vacancy):
+            return False
+        if self.__duplicates_index is not None:
+            # В индекс попадают только вакансии, действительно записанные в файл.
+            self.__duplicates_index.add(vacancy, force=True)
+        return True
 
     def get_vacancies(self) -> List[Vacancy]:
         return self.saver.get_vacancies()
 
+    def iter_vacancies(self) -> Iterator[Vacancy]:
+        return self.saver.iter_vacancies()
+
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         self.saver.delete_vacancy(vacancy)
+        self.__duplicates_index = None
+
+    def remove_near_duplicates(self) -> int:
+        removed = self.saver.remove_near_duplicates()
+        self.__duplicates_index = None
+        return removed
+
+    def delete_where(self, predicate: Callable[[Vacancy], bool]) -> int:
+        removed = self.saver.delete_where(predicate)
+        self.__duplicates_index = None
+        return removed
+
+    def delete_many(self, ids: Iterable[str]) -> int:
+        removed = self.saver.delete_many(ids)
+        self.__duplicates_index = None
+        return removed
+
+    def delete_expired(self, days: int) -> int:
+        removed = self.saver.delete_expired(days)
+        self.__duplicates_index = None
+        return removed
+
+
+def ask_next_page() -> bool:
+    """
+    Спрашивает пользователя, выводить ли следующую страницу вакансий.
+    """
+    answer = input("Enter - следующая страница, q - прекратить вывод: ").strip().lower()
+    return answer != "q"
+
+
+def show_vacancies(vacancies: Iterable[Vacancy], compact: bool = False) -> int:
+    """
+    Постранично выводит вакансии из итератора. Возвращает количество выведенных вакансий.
+    """
+    return print_vacancies_paged(
+        vacancies,
+        page_size=PAGE_SIZE,
+        max_description=DESCRIPTION_LIMIT,
+        compact=compact,
+        pause=ask_next_page,
+    )
+
+
+def stored_vacancies(saver: VacancySaver) -> Optional[Iterator[Vacancy]]:
+    """
+    Возвращает итератор по сохранённым вакансиям или None, если хранилище пусто.
+    Проверяется только первая вакансия, остальные читаются лениво.
+    """
+    vacancies = saver.iter_vacancies()
+    first = next(vacancies, None)
+    if first is None:
+        return None
+    return chain([first], vacancies)
+
+
+def ask_compact() -> bool:
+    """
+    Спрашивает, выводить ли вакансии в компактном табличном виде.
+    """
+    return input("Компактный табличный вывод? (y/N): ").strip().lower() == "y"
+
+
+def ask_query() -> Query:
+    """
+    Собирает составной запрос из ответов пользователя. Пустой ответ означает отсутствие условия.
+    """
+    predicates: List[Predicate] = []
+    title_words = input("Ключевые слова в названии (через пробел): ").strip().split()
+    if title_words:
+        predicates.append(Keyword(title_words, fields=("title",)))
+    description_words = input("Ключевые слова в описании (через пробел): ").strip().split()
+    if description_words:
+        predicates.append(Keyword(description_words))
+    salary_range = SalaryRange.from_string(input("Диапазон зарплат (например, 100000-150000): ").strip())
+    if salary_range is not None:
+        predicates.append(salary_range)
+    currency = input("Валюта (например, RUR): ").strip()
+    if currency:
+        predicates.append(Currency(currency))
+    domain = input("Домен ссылки (например, hh.ru): ").strip()
+    if domain:
+        predicates.append(Domain(domain))
+    top_n_input = input("Сколько вакансий вывести (пусто - все): ").strip()
+    limit = int(top_n_input) if top_n_input.isdigit() else None
+    where = And(*predicates) if predicates else None
+    return Query(where=where, order_by="salary", descending=True, limit=limit)
 
 
 def user_interaction() -> None:
@@ -50,8 +169,9 @@ def user_interaction() -> None:
     default_per_page = int(os.getenv("DEFAULT_PER_PAGE", DEFAULT_PER_PAGE))
 
     hh_api = HeadHunterAPI()
-    saver = VacancySaver(filename=vacancy_file)
+    saver = VacancySaver(filename=vacancy_file, parallel=PARALLEL_LOAD, near_duplicates=NEAR_DUPLICATES)
     vacancies_list: List[Vacancy] = []
+    index: Optional[VacancyIndex] = None
 
     while True:
         print("\nМеню:")
@@ -61,6 +181,9 @@ def user_interaction() -> None:
         print("4. Фильтровать вакансии по ключевому слову в описании")
         print("5. Фильтровать вакансии по диапазону зарплат")
         print("6. Удалить вакансию по названию")
+        print("7. Поиск по нескольким условиям")
+        print("8. Удалить почти одинаковые вакансии")
+        print("9. Удалить вакансии старше N дней")
         print("0. Выйти")
 
         choice = input("Выберите действие: ").strip()
@@ -76,19 +199,19 @@ def user_interaction() -> None:
             try:
                 vacancies_json = hh_api.get_vacancies(query, per_page=per_page)
                 vacancies_list = Vacancy.cast_to_object_list(vacancies_json)
-                for v in vacancies_list:
-                    saver.add_vacancy(v)
-                print(f"Загружено и сохранено {len(vacancies_list)} вакансий.")
+                added = sum(saver.add_vacancy(v) for v in vacancies_list)
+                index = None
+                print(f"Загружено {len(vacancies_list)} вакансий, сохранено {added}.")
             except Exception as e:
                 logger.error(f"Ошибка при получении вакансий: {e}")
                 print(f"Ошибка при получении вакансий: {e}")
 
         elif choice == "2":
-            vacancies = saver.get_vacancies()
-            if not vacancies:
+            stored = stored_vacancies(saver)
+            if stored is None:
                 print("Нет сохранённых вакансий.")
-            else:
-                print_vacancies(vacancies)
+                continue
+            show_vacancies(stored, compact=ask_compact())
 
         elif choice == "3":
             vacancies = saver.get_vacancies()
@@ -105,42 +228,58 @@ def user_interaction() -> None:
             print_vacancies(top_vacancies)
 
         elif choice == "4":
-            vacancies = saver.get_vacancies()
-            if not vacancies:
+            stored = stored_vacancies(saver)
+            if stored is None:
                 print("Нет сохранённых вакансий.")
                 continue
             filter_words = input("Введите ключевые слова для фильтрации (через пробел): ").strip().split()
-            filtered = filter_vacancies(vacancies, filter_words)
-            if filtered:
-                print_vacancies(filtered)
-            else:
+            filtered = iter_filter_vacancies(stored, filter_words)
+            if not show_vacancies(filtered, compact=ask_compact()):
                 print("Вакансии по заданным ключевым словам не найдены.")
 
         elif choice == "5":
-            vacancies = saver.get_vacancies()
-            if not vacancies:
+            stored = stored_vacancies(saver)
+            if stored is None:
                 print("Нет сохранённых вакансий.")
                 continue
             salary_range = input("Введите диапазон зарплат (например, 100000-150000): ").strip()
-            ranged = get_vacancies_by_salary(vacancies, salary_range)
-            if ranged:
-                print_vacancies(ranged)
-            else:
+            ranged = iter_vacancies_by_salary(stored, salary_range)
+            if not show_vacancies(ranged, compact=ask_compact()):
                 print("Вакансии в заданном диапазоне зарплат не найдены.")
 
         elif choice == "6":
-            vacancies = saver.get_vacancies()
-            if not vacancies:
-                print("Нет сохранённых вакансий.")
-                continue
             title = input("Введите точное название вакансии для удаления: ").strip()
-            found = [v for v in vacancies if v.title == title]
-            if not found:
+            removed = saver.delete_where(lambda v: v.title == title)
+            if not removed:
                 print("Вакансия не найдена.")
             else:
-                for v in found:
-                    saver.delete_vacancy(v)
-                print("Вакансия удалена.")
+                index = None
+                print(f"Удалено вакансий: {removed}.")
+
+        elif choice == "7":
+            vacancy_query = ask_query()
+            if index is None:
+                index = VacancyIndex(saver.iter_vacancies())
+            if not show_vacancies(vacancy_query.run_indexed(index), compact=ask_compact()):
+                print("Вакансии по заданным условиям не найдены.")
+
+        elif choice == "8":
+            removed = saver.remove_near_duplicates()
+            index = None
+            print(f"Удалено дубликатов: {removed}.")
+
+        elif choice == "9":
+            try:
+                days = int(input("Удалить вакансии, опубликованные больше N дней назад. N: ").strip())
+            except ValueError:
+                print("Некорректное число.")
+                continue
+            if days < 0:
+                print("Некорректное число.")
+                continue
+            removed = saver.delete_expired(days)
+            index = None
+            print(f"Удалено устаревших вакансий: {removed}.")
 
         elif choice == "0":
             print("Выход.")
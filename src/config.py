@@ -7,4 +7,8 @@ load_dotenv()  # Загружает переменные из .env в окруж
 VACANCY_FILE = os.getenv("VACANCY_FILE", "data/vacancies.json")
 DEFAULT_PER_PAGE = int(os.getenv("DEFAULT_PER_PAGE", 20))
 HH_API_URL = os.getenv("HH_API_URL", "https://api.hh.ru/vacancies")
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", 20))
+DESCRIPTION_LIMIT = int(os.getenv("DESCRIPTION_LIMIT", 200))
+PARALLEL_LOAD = os.getenv("PARALLEL_LOAD", "false").lower() in ("1", "true", "yes")
+NEAR_DUPLICATES = os.getenv("NEAR_DUPLICATES", "false").lower() in ("1", "true", "yes")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -0,0 +1,148 @@
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.vacancy import Vacancy
+
+TOKEN_RE = re.compile(r"\w+")
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+def shingles(vacancy: Vacancy, size: int = 3) -> Set[int]:
+    """
+    Хэши словесных шинглов (последовательностей из size слов) по названию и описанию вакансии.
+    """
+    tokens = TOKEN_RE.findall(f"{vacancy.title} {vacancy.description}".lower())
+    if len(tokens) < size:
+        grams = [" ".join(tokens)]
+    else:
+        grams = [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+    # zlib.crc32 стабилен между запусками, в отличие от встроенного hash().
+    return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+
+class NearDuplicateIndex:
+    """
+    Индекс для поиска почти одинаковых вакансий (перепубликаций под другой ссылкой
+    или со слегка изменённым названием).
+
+    Для каждой вакансии считается MinHash-сигнатура из num_perm значений, сигнатура
+    делится на bands полос, и вакансия попадает в корзину каждой полосы. Кандидаты
+    ищутся только в своих корзинах, поэтому поиск не перебирает весь архив.
+    Кандидат считается дубликатом, если оценка сходства Жаккара не ниже threshold.
+    """
+
+    def __init__(
+        self,
+        vacancies: Iterable[Vacancy] = (),
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.7,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm должно делиться на bands без остатка")
+        rng = random.Random(seed)
+        self.__permutations = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self.__rows = num_perm // bands
+        self.__bands = bands
+        self.__threshold = threshold
+        self.__shingle_size = shingle_size
+        self.__buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self.__signatures: List[Tuple[int, ...]] = []
+        self.__vacancies: List[Vacancy] = []
+        for vacancy in vacancies:
+            self.add(vacancy, force=True)
+
+    def __len__(self) -> int:
+        return len(self.__vacancies)
+
+    def signature(self, vacancy: Vacancy) -> Tuple[int, ...]:
+        """
+        MinHash-сигнатура вакансии.
+        """
+        hashes = shingles(vacancy, self.__shingle_size)
+        return tuple(
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self.__permutations
+        )
+
+    def __band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = self.__rows
+        return [signature[i * rows:(i + 1) * rows] for i in range(self.__bands)]
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """
+        Оценка сходства Жаккара по двум сигнатурам.
+        """
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+    def __find(self, signature: Tuple[int, ...]) -> Optional[Vacancy]:
+        checked: Set[int] = set()
+        for band, key in enumerate(self.__band_keys(signature)):
+            for pos in self.__buckets[band].get(key, ()):
+                if pos in checked:
+                    continue
+                checked.add(pos)
+                if self.similarity(signature, self.__signatures[pos]) >= self.__threshold:
+                    return self.__vacancies[pos]
+        return None
+
+    def find_duplicate(self, vacancy: Vacancy) -> Optional[Vacancy]:
+        """
+        Возвращает уже проиндексированную почти такую же вакансию или None.
+        """
+        return self.__find(self.signature(vacancy))
+
+    def add(self, vacancy: Vacancy, force: bool = False) -> bool:
+        """
+        Добавляет вакансию в индекс, если у неё нет почти такой же (или если force=True).
+        Возвращает True, если вакансия добавлена.
+        """
+        added, _ = self.__add(vacancy, force)
+        return added
+
+    def add_or_find(self, vacancy: Vacancy) -> Optional[Vacancy]:
+        """
+        Добавляет вакансию, если у неё нет почти такой же, иначе возвращает найденный оригинал.
+        Сигнатура считается один раз.
+        """
+        _, original = self.__add(vacancy, False)
+        return original
+
+    def __add(self, vacancy: Vacancy, force: bool) -> Tuple[bool, Optional[Vacancy]]:
+        signature = self.signature(vacancy)
+        if not force:
+            original = self.__find(signature)
+            if original is not None:
+                return False, original
+        pos = len(self.__vacancies)
+        self.__vacancies.append(vacancy)
+        self.__signatures.append(signature)
+        for band, key in enumerate(self.__band_keys(signature)):
+            self.__buckets[band].setdefault(key, []).append(pos)
+        return True, None
+
+
+def deduplicate(
+    vacancies: Iterable[Vacancy], **params: Any
+) -> Tuple[List[Vacancy], List[Tuple[Vacancy, Vacancy]]]:
+    """
+    Убирает почти одинаковые вакансии, оставляя первую из каждой группы.
+    Возвращает список оставленных вакансий и пары (дубликат, оригинал).
+    Параметры передаются в NearDuplicateIndex.
+    """
+    index = NearDuplicateIndex(**params)
+    kept: List[Vacancy] = []
+    duplicates: List[Tuple[Vacancy, Vacancy]] = []
+    for vacancy in vacancies:
+        original = index.add_or_find(vacancy)
+        if original is None:
+            kept.append(vacancy)
+        else:
+            duplicates.append((vacancy, original))
+    return kept, duplicates
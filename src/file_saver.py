@@ -1,18 +1,55 @@
 import json
 import os
 import csv
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO
 
 from src.config import VACANCY_FILE
+from src.dedup import deduplicate
+from src.parallel_loader import CSV_FIELDNAMES, csv_row_to_vacancy, load_csv, load_jsonl
 from src.vacancy import Vacancy
 
+# umask читается один раз: os.umask() меняет состояние всего процесса.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(filename: str, newline: Optional[str] = None) -> Iterator[TextIO]:
+    """
+    Открывает временный файл рядом с filename и по завершении записи атомарно
+    подменяет им исходный файл. При ошибке исходный файл остаётся нетронутым.
+    Права доступа берутся у исходного файла, для нового файла - по umask, как у open().
+    Если filename - символическая ссылка, перезаписывается файл, на который она указывает.
+    """
+    filename = os.path.realpath(filename)
+    directory = os.path.dirname(filename)
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(filename))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            yield f
+        # mkstemp создаёт файл с правами 0600, иначе os.replace перенёс бы их на хранилище.
+        if os.path.exists(filename):
+            shutil.copymode(filename, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o666 & ~_UMASK)
+        os.replace(tmp_name, filename)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
 
 class VacancyFileSaver(ABC):
     """Абстрактный класс для работы с файлами вакансий."""
 
     @abstractmethod
-    def add_vacancy(self, vacancy: Vacancy) -> None:
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """Добавляет вакансию. Возвращает True, если вакансия записана в файл."""
         pass
 
     @abstractmethod
@@ -23,78 +60,189 @@ class VacancyFileSaver(ABC):
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         pass
 
+    @abstractmethod
+    def _save_to_file(self, vacancies: List[Vacancy]) -> None:
+        pass
+
+    def iter_vacancies(self) -> Iterator[Vacancy]:
+        """Лениво перебирает вакансии. Наследники могут читать файл потоково."""
+        yield from self.get_vacancies()
+
+    def remove_near_duplicates(self) -> int:
+        """
+        Удаляет из файла почти одинаковые вакансии (MinHash/LSH), оставляя первую из каждой группы.
+        Возвращает количество удалённых вакансий.
+        """
+        kept, duplicates = deduplicate(self.iter_vacancies())
+        if duplicates:
+            self._save_to_file(kept)
+        return len(duplicates)
+
+    def delete_where(self, predicate: Callable[[Vacancy], bool]) -> int:
+        """
+        Удаляет все вакансии, для которых predicate вернул True, за один проход
+        по файлу и одну атомарную перезапись. Возвращает количество удалённых вакансий.
+        """
+        kept: List[Vacancy] = []
+        removed = 0
+        for v in self.iter_vacancies():
+            if predicate(v):
+                removed += 1
+            else:
+                kept.append(v)
+        if removed:
+            self._save_to_file(kept)
+        return removed
+
+    def delete_many(self, ids: Iterable[str]) -> int:
+        """
+        Удаляет вакансии по идентификаторам (ссылкам на вакансию). Возвращает количество удалённых.
+        """
+        urls = set(ids)
+        return self.delete_where(lambda v: v.url in urls)
+
+    def delete_expired(self, days: int, now: Optional[datetime] = None) -> int:
+        """
+        Удаляет вакансии, опубликованные больше days дней назад.
+        Вакансии без даты публикации не удаляются. Возвращает количество удалённых.
+        """
+        if days < 0:
+            raise ValueError("Количество дней не может быть отрицательным")
+        now = now if now is not None else datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        deadline = now - timedelta(days=days)
+
+        def expired(v: Vacancy) -> bool:
+            published = v.published
+            if published is None:
+                return False
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            return published < deadline
+
+        return self.delete_where(expired)
 
-class JSONSaver(VacancyFileSaver):
-    """Класс для работы с JSON-файлом вакансий."""
 
-    def __init__(self, filename: str = VACANCY_FILE) -> None:
+class JSONSaver(VacancyFileSaver):
+    """
+    Класс для работы с JSON-файлом вакансий.
+    Файлы с расширением .jsonl хранятся построчно (одна вакансия на строку),
+    такие файлы при parallel=True загружаются в несколько процессов
+    (только массовое чтение; добавление и удаление одной вакансии читают файл в одном процессе).
+    """
+
+    def __init__(self, filename: str = VACANCY_FILE, parallel: bool = False) -> None:
         self.__filename = filename
-
-    def add_vacancy(self, vacancy: Vacancy) -> None:
-        vacancies = self.get_vacancies()
-        if vacancy not in vacancies:
-            vacancies.append(vacancy)
-            self._save_to_file(vacancies)
+        self.__lines = filename.lower().endswith(".jsonl")
+        self.__parallel = parallel
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        # Одна проверка и одна перезапись: параллельный разбор здесь только мешает.
+        vacancies = self.__read_sequential()
+        if vacancy in vacancies:
+            return False
+        vacancies.append(vacancy)
+        self._save_to_file(vacancies)
+        return True
 
     def get_vacancies(self) -> List[Vacancy]:
+        if self.__lines:
+            return load_jsonl(self.__filename, workers=None if self.__parallel else 1)
+        return self.__load_json()
+
+    def iter_vacancies(self) -> Iterator[Vacancy]:
+        """
+        Перебирает вакансии. Файл .jsonl без parallel читается построчно; при parallel=True
+        он загружается целиком через параллельный разбор, а обычный .json - через json.load.
+        """
+        if not self.__lines or self.__parallel:
+            yield from self.get_vacancies()
+            return
         if not os.path.exists(self.__filename):
+            return
+        with open(self.__filename, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield Vacancy(**json.loads(line))
+
+    def __read_sequential(self) -> List[Vacancy]:
+        if self.__lines:
+            return load_jsonl(self.__filename, workers=1)
+        return self.__load_json()
+
+    def __load_json(self) -> List[Vacancy]:
+        if not os.path.exists(self.__filename) or os.path.getsize(self.__filename) == 0:
             return []
         with open(self.__filename, "r", encoding="utf-8") as f:
             data = json.load(f)
             return [Vacancy(**item) for item in data]
 
     def delete_vacancy(self, vacancy: Vacancy) -> None:
-        vacancies = self.get_vacancies()
+        vacancies = self.__read_sequential()
         vacancies = [v for v in vacancies if v != vacancy]
         self._save_to_file(vacancies)
 
     def _save_to_file(self, vacancies: List[Vacancy]) -> None:
-        with open(self.__filename, "w", encoding="utf-8") as f:
+        with atomic_write(self.__filename) as f:
+            if self.__lines:
+                f.writelines(json.dumps(v.as_dict(), ensure_ascii=False) + "\n" for v in vacancies)
+                return
             json.dump([v.as_dict() for v in vacancies], f, ensure_ascii=False, indent=2)
 
 
 class CSVSaver(VacancyFileSaver):
-    """Класс для работы с CSV-файлом вакансий."""
+    """
+    Класс для работы с CSV-файлом вакансий.
+    При parallel=True большие файлы загружаются в несколько процессов
+    (только массовое чтение; добавление и удаление одной вакансии читают файл в одном процессе).
+    """
 
-    def __init__(self, filename: str = "data/vacancies.csv") -> None:
+    def __init__(self, filename: str = "data/vacancies.csv", parallel: bool = False) -> None:
         self.__filename = filename
-
-    def add_vacancy(self, vacancy: Vacancy) -> None:
-        vacancies = self.get_vacancies()
-        if vacancy not in vacancies:
-            vacancies.append(vacancy)
-            self._save_to_file(vacancies)
+        self.__parallel = parallel
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        # Одна проверка и одна перезапись: параллельный разбор здесь только мешает.
+        vacancies = self.__read_sequential()
+        if vacancy in vacancies:
+            return False
+        vacancies.append(vacancy)
+        self._save_to_file(vacancies)
+        return True
 
     def get_vacancies(self) -> List[Vacancy]:
+        if self.__parallel:
+            return load_csv(self.__filename)
+        return self.__read_sequential()
+
+    def __read_sequential(self) -> List[Vacancy]:
+        return load_csv(self.__filename, workers=1)
+
+    def iter_vacancies(self) -> Iterator[Vacancy]:
+        """
+        Построчно читает CSV-файл, не загружая его целиком в память.
+        При parallel=True файл загружается целиком через параллельный разбор (load_csv):
+        так массовые операции (фильтры, запросы, удаление, поиск дубликатов) тоже идут параллельно.
+        """
+        if self.__parallel:
+            yield from load_csv(self.__filename)
+            return
         if not os.path.exists(self.__filename):
-            return []
-        vacancies = []
-        with open(self.__filename, newline='', encoding='utf-8') as csvfile:
+            return
+        with open(self.__filename, newline='', encoding='utf-8-sig') as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
-                salary = 0
-                try:
-                    salary = int(row.get('salary', '0'))
-                except ValueError:
-                    pass
-                vacancy = Vacancy(
-                    title=row.get('title', ''),
-                    url=row.get('url', ''),
-                    salary=salary,
-                    description=row.get('description', '')
-                )
-                vacancies.append(vacancy)
-        return vacancies
+                yield csv_row_to_vacancy(row)
 
     def delete_vacancy(self, vacancy: Vacancy) -> None:
-        vacancies = self.get_vacancies()
+        vacancies = self.__read_sequential()
         vacancies = [v for v in vacancies if v != vacancy]
         self._save_to_file(vacancies)
 
     def _save_to_file(self, vacancies: List[Vacancy]) -> None:
-        with open(self.__filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'url', 'salary', 'description']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with atomic_write(self.__filename, newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
             for v in vacancies:
                 writer.writerow(v.as_dict())
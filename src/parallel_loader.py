@@ -0,0 +1,188 @@
+import csv
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.vacancy import Vacancy
+
+CSV_FIELDNAMES = ['title', 'url', 'salary', 'description', 'currency', 'published_at']
+# Файлы меньше этого размера читаются в одном процессе: запуск пула дороже разбора.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# Размер блока при поиске границ записей в CSV.
+BLOCK_SIZE = 1024 * 1024
+
+
+def csv_row_to_vacancy(row: Dict[str, Any]) -> Vacancy:
+    """
+    Преобразует строку CSV (словарь из csv.DictReader) в объект Vacancy.
+    """
+    salary = 0
+    try:
+        salary = int(row.get('salary', '0'))
+    except (TypeError, ValueError):
+        pass
+    return Vacancy(
+        title=row.get('title', ''),
+        url=row.get('url', ''),
+        salary=salary,
+        description=row.get('description', ''),
+        currency=row.get('currency', ''),
+        published_at=row.get('published_at', '')
+    )
+
+
+def find_csv_boundaries(filename: str, start: int, parts: int, block_size: int = BLOCK_SIZE) -> List[int]:
+    """
+    Делит файл (начиная со смещения start) примерно на parts частей по границам записей CSV.
+    Перевод строки считается границей, только если до него прочитано чётное число кавычек,
+    т.е. он не находится внутри экранированного поля. Файл читается блоками по block_size байт,
+    целиком в память он не загружается.
+    Возвращает список смещений, включая start и размер файла.
+    """
+    size = os.path.getsize(filename)
+    step = max((size - start) // max(parts, 1), 1)
+    boundaries = [start]
+    target = start + step
+    quotes = 0
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        offset = start
+        while target < size:
+            block = f.read(block_size)
+            if not block:
+                break
+            pos = 0
+            while target < size:
+                if offset + pos < target:
+                    skip_to = min(target - offset, len(block))
+                    quotes += block.count(b'"', pos, skip_to)
+                    pos = skip_to
+                    if pos >= len(block):
+                        break
+                newline = block.find(b'\n', pos)
+                if newline == -1:
+                    quotes += block.count(b'"', pos)
+                    break
+                quotes += block.count(b'"', pos, newline)
+                pos = newline + 1
+                if quotes % 2 == 0:
+                    boundaries.append(offset + pos)
+                    target = offset + pos + step
+            offset += len(block)
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+def find_line_boundaries(filename: str, start: int, parts: int) -> List[int]:
+    """
+    Делит файл (начиная со смещения start) примерно на parts частей по переводам строк (для JSONL).
+    Для каждой части выполняется seek на примерную границу и readline() до конца строки.
+    Возвращает список смещений, включая start и размер файла.
+    """
+    size = os.path.getsize(filename)
+    parts = max(parts, 1)
+    boundaries = [start]
+    with open(filename, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(start + (size - start) * i // parts)
+            f.readline()
+            boundary = f.tell()
+            if boundaries[-1] < boundary < size:
+                boundaries.append(boundary)
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+def read_csv_header(filename: str) -> Tuple[List[str], int]:
+    """
+    Читает заголовок CSV-файла (с учётом переводов строк внутри кавычек).
+    Возвращает имена полей и смещение начала первой записи.
+    """
+    with open(filename, 'rb') as f:
+        header = f.readline()
+        while header.count(b'"') % 2:
+            line = f.readline()
+            if not line:
+                break
+            header += line
+        end = f.tell()
+    fieldnames = next(csv.reader(io.StringIO(header.decode('utf-8-sig'), newline='')), CSV_FIELDNAMES)
+    return fieldnames, end
+
+
+def parse_csv_chunk(args: Tuple[str, int, int, List[str]]) -> List[Vacancy]:
+    """
+    Разбирает фрагмент CSV-файла [start, end) без строки заголовка.
+    """
+    filename, start, end, fieldnames = args
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start).decode('utf-8')
+    reader = csv.DictReader(io.StringIO(chunk, newline=''), fieldnames=fieldnames)
+    return [csv_row_to_vacancy(row) for row in reader]
+
+
+def parse_jsonl_chunk(args: Tuple[str, int, int]) -> List[Vacancy]:
+    """
+    Разбирает фрагмент JSONL-файла [start, end): по одной вакансии на строку.
+    """
+    filename, start, end = args
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    return [Vacancy(**json.loads(line)) for line in chunk.splitlines() if line.strip()]
+
+
+def _run_chunks(worker: Any, tasks: List[Any], workers: int) -> List[Vacancy]:
+    vacancies: List[Vacancy] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(worker, tasks):
+            vacancies.extend(part)
+    return vacancies
+
+
+def _worker_count(workers: Optional[int]) -> int:
+    return workers if workers is not None else (os.cpu_count() or 1)
+
+
+def load_csv(filename: str, workers: Optional[int] = None, min_size: int = PARALLEL_MIN_BYTES) -> List[Vacancy]:
+    """
+    Загружает вакансии из CSV-файла. Большие файлы делятся по границам записей
+    и разбираются параллельно в ProcessPoolExecutor; порядок вакансий сохраняется.
+    Маленькие файлы (или workers <= 1) разбираются в текущем процессе.
+    """
+    if not os.path.exists(filename):
+        return []
+    workers = _worker_count(workers)
+    size = os.path.getsize(filename)
+    if workers <= 1 or size < min_size:
+        with open(filename, newline='', encoding='utf-8-sig') as csvfile:
+            return [csv_row_to_vacancy(row) for row in csv.DictReader(csvfile)]
+    if size == 0:
+        return []
+    fieldnames, header_end = read_csv_header(filename)
+    boundaries = find_csv_boundaries(filename, header_end, workers)
+    tasks = [(filename, start, end, fieldnames) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+    return _run_chunks(parse_csv_chunk, tasks, workers)
+
+
+def load_jsonl(filename: str, workers: Optional[int] = None, min_size: int = PARALLEL_MIN_BYTES) -> List[Vacancy]:
+    """
+    Загружает вакансии из JSONL-файла. Большие файлы делятся по строкам
+    и разбираются параллельно; маленькие - в текущем процессе.
+    """
+    if not os.path.exists(filename):
+        return []
+    workers = _worker_count(workers)
+    size = os.path.getsize(filename)
+    if workers <= 1 or size < min_size:
+        return parse_jsonl_chunk((filename, 0, size))
+    if size == 0:
+        return []
+    boundaries = find_line_boundaries(filename, 0, workers)
+    tasks = [(filename, start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+    return _run_chunks(parse_jsonl_chunk, tasks, workers)
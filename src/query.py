@@ -0,0 +1,352 @@
+import heapq
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from src.utils import parse_salary_range
+from src.vacancy import Vacancy
+
+TOKEN_RE = re.compile(r"\w+")
+# Если кандидатов хотя бы в столько раз меньше, чем вакансий, они сортируются напрямую.
+SMALL_CANDIDATES_RATIO = 4
+
+ORDER_KEYS: Dict[str, Callable[[Vacancy], Any]] = {
+    "salary": lambda v: v.salary,
+    "title": lambda v: v.title.lower(),
+}
+
+
+def url_domain(url: str) -> str:
+    """
+    Возвращает домен ссылки в нижнем регистре без префикса www.
+    """
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+class VacancyIndex:
+    """
+    Индексы в памяти над списком вакансий: по словам в названии и описании,
+    по зарплате (отсортированный список), по валюте и по домену ссылки.
+    Позиции вакансий в индексах совпадают с их позициями в исходном списке.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy]) -> None:
+        self.vacancies: List[Vacancy] = list(vacancies)
+        self.tokens: Dict[str, Dict[str, Set[int]]] = {"title": {}, "description": {}}
+        self.currencies: Dict[str, Set[int]] = {}
+        self.domains: Dict[str, Set[int]] = {}
+        salaries: List[Tuple[int, int]] = []
+        for pos, v in enumerate(self.vacancies):
+            for field in ("title", "description"):
+                postings = self.tokens[field]
+                for token in TOKEN_RE.findall(getattr(v, field).lower()):
+                    postings.setdefault(token, set()).add(pos)
+            self.currencies.setdefault(v.currency, set()).add(pos)
+            self.domains.setdefault(url_domain(v.url), set()).add(pos)
+            salaries.append((v.salary, pos))
+        salaries.sort()
+        self.salary_values = [salary for salary, _ in salaries]
+        self.salary_positions = [pos for _, pos in salaries]
+        # Для обхода по убыванию равные зарплаты идут в порядке добавления, как в sorted(reverse=True).
+        self.salary_positions_desc = [pos for _, pos in sorted(salaries, key=lambda item: (-item[0], item[1]))]
+
+    def __len__(self) -> int:
+        return len(self.vacancies)
+
+    def __salary_slice(self, min_salary: int, max_salary: Optional[int]) -> Tuple[int, int]:
+        left = bisect_left(self.salary_values, min_salary)
+        right = len(self.salary_values) if max_salary is None else bisect_right(self.salary_values, max_salary)
+        return left, max(left, right)
+
+    def salary_count(self, min_salary: int, max_salary: Optional[int]) -> int:
+        left, right = self.__salary_slice(min_salary, max_salary)
+        return right - left
+
+    def salary_between(self, min_salary: int, max_salary: Optional[int]) -> Set[int]:
+        left, right = self.__salary_slice(min_salary, max_salary)
+        return set(self.salary_positions[left:right])
+
+
+class Predicate(ABC):
+    """
+    Условие отбора вакансий. Условия комбинируются операторами &, | и ~.
+    """
+
+    @abstractmethod
+    def matches(self, vacancy: Vacancy) -> bool:
+        pass
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        """
+        Дешёвая верхняя оценка числа кандидатов по индексу (без построения множества)
+        или None, если индекс неприменим.
+        """
+        return None
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        """
+        Надмножество позиций подходящих вакансий по индексу или None, если индекс неприменим.
+        """
+        return None
+
+    def __call__(self, vacancy: Vacancy) -> bool:
+        return self.matches(vacancy)
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+class Keyword(Predicate):
+    """
+    Хотя бы одно из ключевых слов встречается (как подстрока) в указанных полях.
+    """
+
+    def __init__(self, words: Iterable[str], fields: Tuple[str, ...] = ("description",)) -> None:
+        self.words = [word.lower() for word in words if word]
+        self.fields = fields
+        self.__cached: Optional[Tuple[VacancyIndex, Optional[List[Set[int]]]]] = None
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        texts = [getattr(vacancy, field).lower() for field in self.fields]
+        return any(word in text for word in self.words for text in texts)
+
+    def _postings(self, index: VacancyIndex) -> Optional[List[Set[int]]]:
+        # Результат запоминается для последнего индекса: планировщик вызывает
+        # estimate() и candidates() подряд, и словарь не должен сканироваться дважды.
+        if self.__cached is not None and self.__cached[0] is index:
+            return self.__cached[1]
+        postings: Optional[List[Set[int]]] = None
+        # Подстрока без разделителей целиком лежит внутри одного токена,
+        # поэтому достаточно пройти по словарю индекса, а не по всем вакансиям.
+        if all(TOKEN_RE.fullmatch(word) for word in self.words):
+            postings = [
+                token_postings
+                for field in self.fields
+                for token, token_postings in index.tokens[field].items()
+                if any(word in token for word in self.words)
+            ]
+        self.__cached = (index, postings)
+        return postings
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        postings = self._postings(index)
+        return None if postings is None else sum(len(p) for p in postings)
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        postings = self._postings(index)
+        return None if postings is None else set().union(*postings)
+
+
+class SalaryRange(Predicate):
+    """
+    Зарплата в диапазоне [min_salary, max_salary] включительно.
+    """
+
+    def __init__(self, min_salary: int = 0, max_salary: Optional[int] = None) -> None:
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+
+    @classmethod
+    def from_string(cls, salary_range: str) -> Optional["SalaryRange"]:
+        """
+        Создаёт условие из строки "min-max". Возвращает None при некорректном формате.
+        """
+        bounds = parse_salary_range(salary_range)
+        return cls(*bounds) if bounds is not None else None
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        if vacancy.salary < self.min_salary:
+            return False
+        return self.max_salary is None or vacancy.salary <= self.max_salary
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        return index.salary_count(self.min_salary, self.max_salary)
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        return index.salary_between(self.min_salary, self.max_salary)
+
+
+class Currency(Predicate):
+    """
+    Валюта зарплаты совпадает с одной из указанных.
+    """
+
+    def __init__(self, *codes: str) -> None:
+        self.codes = {code.strip().upper() for code in codes}
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return vacancy.currency in self.codes
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        return sum(len(index.currencies.get(code, ())) for code in self.codes)
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        return set().union(*(index.currencies.get(code, set()) for code in self.codes))
+
+
+class Domain(Predicate):
+    """
+    Ссылка ведёт на указанный домен или его поддомен.
+    """
+
+    def __init__(self, domain: str) -> None:
+        self.domain = url_domain(domain) if "//" in domain else domain.lower().removeprefix("www.")
+
+    def _accepts(self, domain: str) -> bool:
+        return domain == self.domain or domain.endswith("." + self.domain)
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return self._accepts(url_domain(vacancy.url))
+
+    def _postings(self, index: VacancyIndex) -> List[Set[int]]:
+        return [postings for domain, postings in index.domains.items() if self._accepts(domain)]
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        return sum(len(postings) for postings in self._postings(index))
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        return set().union(*self._postings(index))
+
+
+class And(Predicate):
+    """
+    Все условия выполняются.
+    """
+
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = list(predicates)
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return all(p.matches(vacancy) for p in self.predicates)
+
+    def _most_selective(self, index: VacancyIndex) -> Optional[Tuple[int, Predicate]]:
+        estimates = [(p.estimate(index), p) for p in self.predicates]
+        indexed = [(estimate, p) for estimate, p in estimates if estimate is not None]
+        return min(indexed, key=lambda item: item[0]) if indexed else None
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        best = self._most_selective(index)
+        return None if best is None else best[0]
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        # Планировщик: по дешёвым оценкам выбираем самый селективный индекс и строим
+        # только его множество; остальные условия проверяются через matches().
+        best = self._most_selective(index)
+        return None if best is None else best[1].candidates(index)
+
+
+class Or(Predicate):
+    """
+    Выполняется хотя бы одно из условий.
+    """
+
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = list(predicates)
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return any(p.matches(vacancy) for p in self.predicates)
+
+    def estimate(self, index: VacancyIndex) -> Optional[int]:
+        total = 0
+        for p in self.predicates:
+            estimate = p.estimate(index)
+            if estimate is None:
+                return None
+            total += estimate
+        return total
+
+    def candidates(self, index: VacancyIndex) -> Optional[Set[int]]:
+        result: Set[int] = set()
+        for p in self.predicates:
+            candidate_set = p.candidates(index)
+            if candidate_set is None:
+                return None
+            result |= candidate_set
+        return result
+
+
+class Not(Predicate):
+    """
+    Условие не выполняется.
+    """
+
+    def __init__(self, predicate: Predicate) -> None:
+        self.predicate = predicate
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return not self.predicate.matches(vacancy)
+
+
+class Query:
+    """
+    Запрос к вакансиям: условие отбора, сортировка и ограничение количества.
+    """
+
+    def __init__(
+        self,
+        where: Optional[Predicate] = None,
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> None:
+        if order_by is not None and order_by not in ORDER_KEYS:
+            raise ValueError(f"Неизвестное поле сортировки: {order_by}")
+        self.where = where
+        self.order_by = order_by
+        self.descending = descending
+        self.limit = limit
+
+    def _accepts(self, vacancy: Vacancy) -> bool:
+        return self.where is None or self.where.matches(vacancy)
+
+    def run(self, vacancies: Iterable[Vacancy]) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос полным проходом по итератору без индексов.
+        Без сортировки вывод ленивый и останавливается после limit вакансий.
+        """
+        matched = (v for v in vacancies if self._accepts(v))
+        return self._order_and_limit(matched)
+
+    def run_indexed(self, index: VacancyIndex) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос по индексу: сначала сужает множество кандидатов,
+        затем проверяет условие только для них.
+        """
+        candidates = self.where.candidates(index) if self.where is not None else None
+        if self.order_by == "salary":
+            positions: Iterable[int]
+            if candidates is not None and len(candidates) * SMALL_CANDIDATES_RATIO <= len(index):
+                # Кандидатов мало: сортируем их напрямую, не обходя весь индекс зарплат.
+                vacancies = index.vacancies
+                if self.descending:
+                    positions = sorted(candidates, key=lambda pos: (-vacancies[pos].salary, pos))
+                else:
+                    positions = sorted(candidates, key=lambda pos: (vacancies[pos].salary, pos))
+            else:
+                # Обходим индекс зарплат в нужном порядке и останавливаемся на limit.
+                order = index.salary_positions_desc if self.descending else index.salary_positions
+                positions = order if candidates is None else (pos for pos in order if pos in candidates)
+            matched = (index.vacancies[pos] for pos in positions if self._accepts(index.vacancies[pos]))
+            return islice(matched, self.limit)
+        positions = sorted(candidates) if candidates is not None else range(len(index))
+        matched = (index.vacancies[pos] for pos in positions if self._accepts(index.vacancies[pos]))
+        return self._order_and_limit(matched)
+
+    def _order_and_limit(self, matched: Iterator[Vacancy]) -> Iterator[Vacancy]:
+        if self.order_by is None:
+            return islice(matched, self.limit)
+        key = ORDER_KEYS[self.order_by]
+        if self.limit is not None:
+            pick = heapq.nlargest if self.descending else heapq.nsmallest
+            return iter(pick(self.limit, matched, key=key))
+        return iter(sorted(matched, key=key, reverse=self.descending))
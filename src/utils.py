@@ -1,29 +1,64 @@
-from typing import List
+import sys
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO
 
 from src.vacancy import Vacancy
 
+TABLE_HEADER = f"{'Зарплата':>10} | {'Название':<40} | Ссылка"
+
+
+def iter_filter_vacancies(vacancies: Iterable[Vacancy], keywords: List[str]) -> Iterator[Vacancy]:
+    """
+    Лениво отбирает вакансии, в описании которых есть хотя бы одно из ключевых слов.
+    """
+    words = [word.lower() for word in keywords]
+    for v in vacancies:
+        description = v.description.lower()
+        if any(word in description for word in words):
+            yield v
+
 
 def filter_vacancies(vacancies: List[Vacancy], keywords: List[str]) -> List[Vacancy]:
     """
     Фильтрует список вакансий, оставляя только те, в описании которых есть хотя бы одно из ключевых слов.
     """
-    result: List[Vacancy] = []
-    for v in vacancies:
-        if any(word.lower() in v.description.lower() for word in keywords):
-            result.append(v)
-    return result
+    return list(iter_filter_vacancies(vacancies, keywords))
 
 
-def get_vacancies_by_salary(vacancies: List[Vacancy], salary_range: str) -> List[Vacancy]:
+def parse_salary_range(salary_range: str) -> Optional[tuple[int, int]]:
     """
-    Фильтрует вакансии по заданному диапазону зарплат.
+    Разбирает строку диапазона зарплат вида "min-max". Возвращает None при некорректном формате.
     """
     try:
         min_salary, max_salary = map(int, salary_range.replace(' ', '').split('-'))
     except Exception:
+        return None
+    return min_salary, max_salary
+
+
+def iter_vacancies_by_salary(vacancies: Iterable[Vacancy], salary_range: str) -> Iterator[Vacancy]:
+    """
+    Лениво отбирает вакансии из заданного диапазона зарплат.
+    При некорректном формате диапазона вакансии проходят без фильтрации.
+    """
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
+        yield from vacancies
+        return
+    min_salary, max_salary = bounds
+    for v in vacancies:
+        if min_salary <= v.salary <= max_salary:
+            yield v
+
+
+def get_vacancies_by_salary(vacancies: List[Vacancy], salary_range: str) -> List[Vacancy]:
+    """
+    Фильтрует вакансии по заданному диапазону зарплат.
+    """
+    if parse_salary_range(salary_range) is None:
         # Если формат некорректный, возвращаем исходный список без фильтрации
         return vacancies
-    return [v for v in vacancies if min_salary <= v.salary <= max_salary]
+    return list(iter_vacancies_by_salary(vacancies, salary_range))
 
 
 def sort_vacancies(vacancies: List[Vacancy]) -> List[Vacancy]:
@@ -40,15 +75,63 @@ def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     return vacancies[:top_n]
 
 
-def print_vacancies(vacancies: List[Vacancy]) -> None:
+def truncate(text: str, limit: Optional[int]) -> str:
+    """
+    Обрезает текст до limit символов, добавляя многоточие. None или 0 - без ограничения.
+    """
+    if not limit or len(text) <= limit:
+        return text
+    return text[:max(limit - 1, 0)] + "…"
+
+
+def format_vacancy(vacancy: Vacancy, max_description: Optional[int] = None, compact: bool = False) -> str:
+    """
+    Форматирует вакансию для вывода: подробно (по умолчанию) или одной строкой таблицы.
+    """
+    if compact:
+        return f"{vacancy.salary:>10} | {truncate(vacancy.title, 40):<40} | {vacancy.url}\n"
+    return (
+        f"Название: {vacancy.title}\n"
+        f"Ссылка: {vacancy.url}\n"
+        f"Зарплата: {vacancy.salary}\n"
+        f"Описание: {truncate(vacancy.description, max_description)}\n"
+        f"{'-'*40}\n"
+    )
+
+
+def print_vacancies_paged(
+    vacancies: Iterable[Vacancy],
+    page_size: int = 20,
+    max_description: Optional[int] = None,
+    compact: bool = False,
+    stream: Optional[TextIO] = None,
+    pause: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Постранично выводит вакансии, забирая их из итератора по одной странице.
+    Каждая страница форматируется в буфер и записывается в поток одним вызовом.
+    После каждой страницы (если есть следующая) вызывается pause; если она вернула False, вывод прекращается.
+    Возвращает количество выведенных вакансий.
+    """
+    out = stream if stream is not None else sys.stdout
+    iterator = iter(vacancies)
+    page_size = max(page_size, 1)
+    printed = 0
+    page = list(islice(iterator, page_size))
+    while page:
+        chunks = [TABLE_HEADER + "\n"] if compact else []
+        chunks.extend(format_vacancy(v, max_description, compact) for v in page)
+        out.write("".join(chunks))
+        out.flush()
+        printed += len(page)
+        page = list(islice(iterator, page_size))
+        if page and pause is not None and not pause():
+            break
+    return printed
+
+
+def print_vacancies(vacancies: Iterable[Vacancy]) -> None:
     """
     Выводит список вакансий в удобочитаемом формате в консоль.
     """
-    for v in vacancies:
-        print(
-            f"Название: {v.title}\n"
-            f"Ссылка: {v.url}\n"
-            f"Зарплата: {v.salary}\n"
-            f"Описание: {v.description}\n"
-            f"{'-'*40}"
-        )
+    print_vacancies_paged(vacancies, page_size=100)
@@ -1,17 +1,22 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class Vacancy:
     """
     Класс для представления вакансии.
     """
-    __slots__ = ('__title', '__url', '__salary', '__description')
+    __slots__ = ('__title', '__url', '__salary', '__description', '__currency', '__published_at')
 
-    def __init__(self, title: str, url: str, salary: int, description: str):
+    def __init__(
+        self, title: str, url: str, salary: int, description: str, currency: str = "RUR", published_at: str = ""
+    ):
         self.__title = self.__validate_title(title)
         self.__url = self.__validate_url(url)
         self.__salary = self.__validate_salary(salary)
         self.__description = self.__validate_description(description)
+        self.__currency = self.__validate_currency(currency)
+        self.__published_at = self.__validate_published_at(published_at)
 
     @staticmethod
     def __validate_title(title: str) -> str:
@@ -32,6 +37,14 @@ class Vacancy:
     def __validate_description(description: str) -> str:
         return description.strip() if description else "Нет описания"
 
+    @staticmethod
+    def __validate_currency(currency: str) -> str:
+        return currency.strip().upper() if currency else "RUR"
+
+    @staticmethod
+    def __validate_published_at(published_at: str) -> str:
+        return published_at.strip() if published_at else ""
+
     @property
     def title(self) -> str:
         return self.__title
@@ -48,6 +61,30 @@ class Vacancy:
     def description(self) -> str:
         return self.__description
 
+    @property
+    def currency(self) -> str:
+        return self.__currency
+
+    @property
+    def published_at(self) -> str:
+        return self.__published_at
+
+    @property
+    def published(self) -> Optional[datetime]:
+        """
+        Дата публикации (формат hh.ru: 2024-05-01T12:00:00+0300) или None, если она неизвестна.
+        """
+        if not self.__published_at:
+            return None
+        try:
+            return datetime.strptime(self.__published_at, "%Y-%m-%dT%H:%M:%S%z")
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(self.__published_at)
+        except ValueError:
+            return None
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Vacancy):
             return NotImplemented
@@ -63,6 +100,14 @@ class Vacancy:
             return NotImplemented
         return self.salary > other.salary
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str, int, str, str, str]]:
+        """
+        Компактная сериализация для pickle (передача вакансий между процессами).
+        """
+        return self.__class__, (
+            self.title, self.url, self.salary, self.description, self.currency, self.published_at
+        )
+
     def as_dict(self) -> Dict[str, Any]:
         """
         Представление вакансии в виде словаря.
@@ -71,7 +116,9 @@ class Vacancy:
             "title": self.title,
             "url": self.url,
             "salary": self.salary,
-            "description": self.description
+            "description": self.description,
+            "currency": self.currency,
+            "published_at": self.published_at
         }
 
     @classmethod
@@ -82,14 +129,19 @@ class Vacancy:
         result = []
         for v in vacancies:
             salary = 0
+            currency = ''
             if v.get('salary') and v['salary'].get('from'):
                 salary = v['salary']['from']
+            if v.get('salary'):
+                currency = v['salary'].get('currency') or ''
             result.append(
                 cls(
                     v.get('name', ''),
                     v.get('alternate_url', ''),
                     salary,
-                    v.get('snippet', {}).get('requirement', '') or v.get('snippet', {}).get('responsibility', '')
+                    v.get('snippet', {}).get('requirement', '') or v.get('snippet', {}).get('responsibility', ''),
+                    currency,
+                    v.get('published_at', '')
                 )
             )
         return result
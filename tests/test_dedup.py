@@ -0,0 +1,89 @@
+from typing import List, Tuple
+
+import pytest
+
+from src.dedup import NearDuplicateIndex, deduplicate
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def reposted() -> List[Vacancy]:
+    """
+    Фикстура: вакансия, её перепубликация агентством и несвязанная вакансия.
+    """
+    description = ("Разработка backend сервисов на Python, Django и PostgreSQL. "
+                   "Опыт от 3 лет, удалённая работа, ДМС, гибкий график")
+    return [
+        Vacancy("Python Developer (Middle)", "https://hh.ru/vacancy/1", 150000, description),
+        Vacancy("Python Developer Middle", "https://agency.ru/jobs/77", 160000, description + "."),
+        Vacancy("QA Engineer", "https://hh.ru/vacancy/3", 90000, "Ручное тестирование мобильных приложений"),
+    ]
+
+
+def test_find_duplicate(reposted: List[Vacancy]) -> None:
+    """
+    Проверяет, что перепубликация находится, а несвязанная вакансия - нет.
+    """
+    index = NearDuplicateIndex(reposted[:1])
+    assert index.find_duplicate(reposted[1]) is reposted[0]
+    assert index.find_duplicate(reposted[2]) is None
+
+
+def test_add_skips_duplicates(reposted: List[Vacancy]) -> None:
+    """
+    Проверяет, что add не добавляет почти одинаковую вакансию, кроме как с force=True.
+    """
+    index = NearDuplicateIndex()
+    assert index.add(reposted[0]) is True
+    assert index.add(reposted[1]) is False
+    assert index.add(reposted[2]) is True
+    assert len(index) == 2
+    assert index.add(reposted[1], force=True) is True
+
+
+def test_deduplicate_keeps_first(reposted: List[Vacancy]) -> None:
+    """
+    Проверяет пакетное удаление дубликатов с сохранением первой вакансии группы.
+    """
+    kept, duplicates = deduplicate(reposted)
+    assert [v.url for v in kept] == [reposted[0].url, reposted[2].url]
+    assert [(d.url, o.url) for d, o in duplicates] == [(reposted[1].url, reposted[0].url)]
+
+
+def test_different_descriptions_not_merged() -> None:
+    """
+    Проверяет, что вакансии с одинаковым названием, но разным описанием не считаются дубликатами.
+    """
+    first = Vacancy("Python Developer", "url1", 1, "Разработка высоконагруженных сервисов на asyncio и aiohttp")
+    second = Vacancy(
+        "Python Developer", "url2", 1, "Автоматизация отчётности в Excel и написание скриптов для бухгалтерии"
+    )
+    kept, duplicates = deduplicate([first, second])
+    assert len(kept) == 2
+    assert duplicates == []
+
+
+def test_invalid_bands() -> None:
+    """
+    Проверяет ошибку, если num_perm не делится на bands.
+    """
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=10, bands=3)
+
+
+def test_deduplicate_computes_one_signature_per_record(
+    reposted: List[Vacancy], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Проверяет, что пакетная очистка считает MinHash-сигнатуру один раз на вакансию.
+    """
+    calls: List[str] = []
+    signature = NearDuplicateIndex.signature
+
+    def counting(self: NearDuplicateIndex, vacancy: Vacancy) -> Tuple[int, ...]:
+        calls.append(vacancy.url)
+        return signature(self, vacancy)
+
+    monkeypatch.setattr(NearDuplicateIndex, "signature", counting)
+    deduplicate(reposted)
+    assert calls == [v.url for v in reposted]
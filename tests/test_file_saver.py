@@ -1,8 +1,14 @@
 import os
 import pytest
-from typing import Generator
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Callable, Generator, List, Optional, Type, Union
+from src import file_saver
 from src.vacancy import Vacancy
 from src.file_saver import JSONSaver, CSVSaver
+from src.query import Keyword
+
+SaverClass = Union[Type[JSONSaver], Type[CSVSaver]]
 
 
 @pytest.fixture
@@ -44,12 +50,12 @@ def test_json_saver_add_get_delete(sample_vacancy: Vacancy, temp_json_file: str)
 
     assert saver.get_vacancies() == []
 
-    saver.add_vacancy(sample_vacancy)
+    assert saver.add_vacancy(sample_vacancy) is True
     vacancies = saver.get_vacancies()
     assert len(vacancies) == 1
     assert vacancies[0].title == sample_vacancy.title
 
-    saver.add_vacancy(sample_vacancy)  # дубликат не добавится
+    assert saver.add_vacancy(sample_vacancy) is False  # дубликат не добавится
     vacancies = saver.get_vacancies()
     assert len(vacancies) == 1
 
@@ -63,14 +69,131 @@ def test_csv_saver_add_get_delete(sample_vacancy: Vacancy, temp_csv_file: str) -
 
     assert saver.get_vacancies() == []
 
-    saver.add_vacancy(sample_vacancy)
+    assert saver.add_vacancy(sample_vacancy) is True
     vacancies = saver.get_vacancies()
     assert len(vacancies) == 1
     assert vacancies[0].title == sample_vacancy.title
 
-    saver.add_vacancy(sample_vacancy)  # дубликат не добавится
+    assert saver.add_vacancy(sample_vacancy) is False  # дубликат не добавится
     vacancies = saver.get_vacancies()
     assert len(vacancies) == 1
 
     saver.delete_vacancy(sample_vacancy)
     assert saver.get_vacancies() == []
+
+
+def test_json_saver_jsonl_format(sample_vacancy: Vacancy, tmp_path: Path) -> None:
+    """Тестирует построчное хранение вакансий в JSONSaver для файлов .jsonl."""
+    filename = str(tmp_path / "vacancies.jsonl")
+    saver = JSONSaver(filename=filename, parallel=True)
+    saver.add_vacancy(sample_vacancy)
+    saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/2", 90000, "Тесты"))
+    with open(filename, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert [v.title for v in saver.get_vacancies()] == ["Python Developer", "QA"]
+
+
+def test_remove_near_duplicates(temp_csv_file: str) -> None:
+    """Тестирует пакетное удаление почти одинаковых вакансий из файла."""
+    saver = CSVSaver(filename=temp_csv_file)
+    description = "Разработка backend сервисов на Python, Django и PostgreSQL, удалённая работа"
+    saver.add_vacancy(Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, description))
+    saver.add_vacancy(Vacancy("Python Developer!", "https://agency.ru/2", 160000, description))
+    saver.add_vacancy(Vacancy("QA Engineer", "https://hh.ru/vacancy/3", 90000, "Ручное тестирование"))
+
+    assert saver.remove_near_duplicates() == 1
+    assert [v.url for v in saver.get_vacancies()] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3"]
+    assert saver.remove_near_duplicates() == 0
+
+
+@pytest.mark.parametrize("saver_class, suffix", [(JSONSaver, ".json"), (JSONSaver, ".jsonl"), (CSVSaver, ".csv")])
+def test_delete_where_and_many(saver_class: SaverClass, suffix: str, tmp_path: Path) -> None:
+    """Тестирует удаление по условию и по списку ссылок одной перезаписью файла."""
+    saver = saver_class(filename=str(tmp_path / f"vacancies{suffix}"))
+    saver.add_vacancy(Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, "Django"))
+    saver.add_vacancy(Vacancy("QA Engineer", "https://hh.ru/vacancy/2", 90000, "Тестирование"))
+    saver.add_vacancy(Vacancy("Data Scientist", "https://hh.ru/vacancy/3", 200000, "ML"))
+    saver.add_vacancy(Vacancy("Python Developer", "https://hh.ru/vacancy/4", 100000, "Flask"))
+
+    assert saver.delete_where(lambda v: v.title == "Java Developer") == 0
+    assert saver.delete_where(Keyword(["flask"])) == 1
+    assert saver.delete_many(["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/404"]) == 1
+    assert [v.url for v in saver.get_vacancies()] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3"]
+    assert os.listdir(tmp_path) == [f"vacancies{suffix}"]  # временные файлы не остаются
+
+
+def test_delete_expired(temp_csv_file: str) -> None:
+    """Тестирует удаление вакансий старше N дней; вакансии без даты не удаляются."""
+    saver = CSVSaver(filename=temp_csv_file)
+    saver.add_vacancy(Vacancy("Old", "url1", 1, "desc", published_at="2024-01-01T10:00:00+0300"))
+    saver.add_vacancy(Vacancy("New", "url2", 2, "desc", published_at="2024-03-01T10:00:00+0300"))
+    saver.add_vacancy(Vacancy("No date", "url3", 3, "desc"))
+
+    now = datetime(2024, 3, 10, tzinfo=timezone.utc)
+    assert saver.delete_expired(30, now=now) == 1
+    assert [v.title for v in saver.get_vacancies()] == ["New", "No date"]
+
+    with pytest.raises(ValueError):
+        saver.delete_expired(-1, now=now)
+    assert len(saver.get_vacancies()) == 2
+
+
+def test_atomic_write_keeps_file_mode(sample_vacancy: Vacancy, tmp_path: Path) -> None:
+    """Тестирует, что перезапись файла сохраняет его права доступа."""
+    filename = tmp_path / "vacancies.csv"
+    saver = CSVSaver(filename=str(filename))
+    saver.add_vacancy(sample_vacancy)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert filename.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    os.chmod(filename, 0o644)
+    saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/2", 90000, "Тесты"))
+    assert filename.stat().st_mode & 0o777 == 0o644
+
+
+def test_atomic_write_keeps_symlink(sample_vacancy: Vacancy, tmp_path: Path) -> None:
+    """Тестирует, что перезапись через символическую ссылку меняет целевой файл, а ссылка остаётся."""
+    target = tmp_path / "data" / "vacancies.csv"
+    target.parent.mkdir()
+    link = tmp_path / "vacancies.csv"
+    link.symlink_to(target)
+    saver = CSVSaver(filename=str(link))
+    saver.add_vacancy(sample_vacancy)
+    saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/2", 90000, "Тесты"))
+    assert link.is_symlink()
+    assert len(CSVSaver(filename=str(target)).get_vacancies()) == 2
+    assert os.listdir(target.parent) == ["vacancies.csv"]
+
+
+@pytest.mark.parametrize("saver_class, suffix", [(JSONSaver, ".jsonl"), (CSVSaver, ".csv")])
+def test_iter_vacancies_parallel_and_streaming(saver_class: SaverClass, suffix: str, tmp_path: Path) -> None:
+    """Тестирует, что iter_vacancies даёт одинаковый результат в потоковом и параллельном режимах."""
+    filename = str(tmp_path / f"vacancies{suffix}")
+    saver = saver_class(filename=filename)
+    saver.add_vacancy(Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, "Django"))
+    saver.add_vacancy(Vacancy("QA Engineer", "https://hh.ru/vacancy/2", 90000, "Тестирование"))
+
+    expected = ["Python Developer", "QA Engineer"]
+    assert [v.title for v in saver.iter_vacancies()] == expected
+    assert [v.title for v in saver_class(filename=filename, parallel=True).iter_vacancies()] == expected
+
+
+def test_add_vacancy_reads_sequentially(
+    sample_vacancy: Vacancy, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Тестирует, что добавление вакансии читает файл в одном процессе даже при parallel=True."""
+    def sequential_only(loader: Callable[..., List[Vacancy]]) -> Callable[..., List[Vacancy]]:
+        def wrapper(filename: str, workers: Optional[int] = None, **kwargs: Any) -> List[Vacancy]:
+            assert workers == 1, "добавление не должно запускать параллельный разбор"
+            return loader(filename, workers=workers, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(file_saver, "load_csv", sequential_only(file_saver.load_csv))
+    monkeypatch.setattr(file_saver, "load_jsonl", sequential_only(file_saver.load_jsonl))
+    for saver in (
+        CSVSaver(filename=str(tmp_path / "vacancies.csv"), parallel=True),
+        JSONSaver(filename=str(tmp_path / "vacancies.jsonl"), parallel=True),
+    ):
+        assert saver.add_vacancy(sample_vacancy) is True
+        assert saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/2", 90000, "Тесты")) is True
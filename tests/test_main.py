@@ -0,0 +1,39 @@
+from pathlib import Path
+from typing import List
+
+from main import VacancySaver
+from src.vacancy import Vacancy
+
+DESCRIPTION = "Разработка backend сервисов на Python, Django и PostgreSQL, удалённая работа, ДМС"
+
+
+def test_vacancy_saver_skips_reposts(tmp_path: Path) -> None:
+    """
+    Проверяет, что при near_duplicates=True перепубликация не сохраняется,
+    а сумма возвращённых значений равна числу записанных вакансий.
+    """
+    saver = VacancySaver(str(tmp_path / "vacancies.csv"), near_duplicates=True)
+    incoming: List[Vacancy] = [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, DESCRIPTION),
+        Vacancy("Python Developer!", "https://agency.ru/jobs/2", 160000, DESCRIPTION),
+        Vacancy("QA Engineer", "https://hh.ru/vacancy/3", 90000, "Ручное тестирование мобильных приложений"),
+    ]
+    results = [saver.add_vacancy(v) for v in incoming]
+    assert results == [True, False, True]
+    stored = [v.url for v in saver.get_vacancies()]
+    assert stored == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3"]
+    assert sum(results) == len(stored)
+
+
+def test_vacancy_saver_rejected_vacancy_does_not_block_repost(tmp_path: Path) -> None:
+    """
+    Проверяет, что вакансия, отклонённая хранилищем (совпала зарплата), не попадает
+    в индекс дубликатов и не мешает сохранить её перепубликацию.
+    """
+    saver = VacancySaver(str(tmp_path / "vacancies.csv"), near_duplicates=True)
+    assert saver.add_vacancy(Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100, "Django")) is True
+    rejected = Vacancy("QA Engineer", "https://hh.ru/vacancy/2", 100, "Ручное тестирование мобильных приложений")
+    assert saver.add_vacancy(rejected) is False
+    repost = Vacancy("QA Engineer", "https://agency.ru/jobs/2", 200, "Ручное тестирование мобильных приложений")
+    assert saver.add_vacancy(repost) is True
+    assert [v.url for v in saver.get_vacancies()] == ["https://hh.ru/vacancy/1", "https://agency.ru/jobs/2"]
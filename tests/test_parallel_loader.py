@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.parallel_loader import (CSV_FIELDNAMES, find_csv_boundaries,
+                                 find_line_boundaries, load_csv, load_jsonl,
+                                 read_csv_header)
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def many_vacancies() -> List[Vacancy]:
+    """
+    Фикстура со списком вакансий, часть описаний содержит переводы строк и кавычки.
+    """
+    return [
+        Vacancy(f"Vacancy {i}", f"https://hh.ru/vacancy/{i}", i * 1000,
+                f'Строка 1\nСтрока "2", часть {i}' if i % 3 == 0 else f"Описание {i}")
+        for i in range(200)
+    ]
+
+
+def write_csv(path: Path, vacancies: List[Vacancy]) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        for v in vacancies:
+            writer.writerow(v.as_dict())
+
+
+def as_dicts(vacancies: List[Vacancy]) -> List[dict]:
+    return [v.as_dict() for v in vacancies]
+
+
+def test_csv_boundaries_skip_quoted_newlines(tmp_path: Path) -> None:
+    """
+    Проверяет, что граница не ставится на перевод строки внутри кавычек, в том числе на стыке блоков.
+    """
+    data = b'a,b\n"x\ny",1\nz,2\n'
+    path = tmp_path / "quoted.csv"
+    path.write_bytes(data)
+    for block_size in (1, 3, 1024):
+        assert find_csv_boundaries(str(path), 4, len(data), block_size=block_size) == [4, 12, 16]
+
+
+def test_csv_boundaries_are_record_starts(tmp_path: Path, many_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что при поиске блоками каждая граница совпадает с началом записи.
+    """
+    path = tmp_path / "vacancies.csv"
+    write_csv(path, many_vacancies)
+    fieldnames, header_end = read_csv_header(str(path))
+    assert fieldnames == CSV_FIELDNAMES
+    boundaries = find_csv_boundaries(str(path), header_end, 5, block_size=64)
+    assert len(boundaries) > 2
+    data = path.read_bytes()
+    rows = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        chunk = data[start:end].decode("utf-8")
+        rows.extend(csv.DictReader(io.StringIO(chunk, newline=""), fieldnames=fieldnames))
+    assert [row["url"] for row in rows] == [v.url for v in many_vacancies]
+
+
+def test_line_boundaries_cover_data(tmp_path: Path) -> None:
+    """
+    Проверяет, что части JSONL покрывают весь файл и режутся по строкам.
+    """
+    data = b'{"a": 1}\n{"a": 2}\n{"a": 3}\n'
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(data)
+    boundaries = find_line_boundaries(str(path), 0, 2)
+    assert boundaries[0] == 0 and boundaries[-1] == len(data)
+    assert len(boundaries) == 3
+    assert all(data[b - 1:b] == b'\n' for b in boundaries[1:])
+
+
+def test_load_csv_parallel_matches_sequential(tmp_path: Path, many_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что параллельная загрузка CSV даёт тот же результат и порядок.
+    """
+    path = tmp_path / "vacancies.csv"
+    write_csv(path, many_vacancies)
+    sequential = load_csv(str(path), workers=1)
+    parallel = load_csv(str(path), workers=3, min_size=0)
+    assert as_dicts(sequential) == as_dicts(many_vacancies)
+    assert as_dicts(parallel) == as_dicts(many_vacancies)
+
+
+def test_load_jsonl_parallel_matches_sequential(tmp_path: Path, many_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет параллельную загрузку JSONL.
+    """
+    path = tmp_path / "vacancies.jsonl"
+    with open(path, 'w', encoding='utf-8') as f:
+        for v in many_vacancies:
+            f.write(json.dumps(v.as_dict(), ensure_ascii=False) + "\n")
+    assert as_dicts(load_jsonl(str(path), workers=3, min_size=0)) == as_dicts(many_vacancies)
+    assert as_dicts(load_jsonl(str(path), workers=1)) == as_dicts(many_vacancies)
+
+
+def test_load_missing_file(tmp_path: Path) -> None:
+    """
+    Проверяет, что для отсутствующего файла возвращается пустой список.
+    """
+    assert load_csv(str(tmp_path / "missing.csv")) == []
+    assert load_jsonl(str(tmp_path / "missing.jsonl")) == []
+
+
+def test_load_empty_file(tmp_path: Path) -> None:
+    """
+    Проверяет, что пустой файл не ломает параллельную загрузку.
+    """
+    for name, loader in (("empty.csv", load_csv), ("empty.jsonl", load_jsonl)):
+        path = tmp_path / name
+        path.write_bytes(b"")
+        assert loader(str(path), workers=2, min_size=0) == []
+
+
+def test_load_csv_with_bom(tmp_path: Path) -> None:
+    """
+    Проверяет, что BOM в начале CSV одинаково обрабатывается в обоих режимах.
+    """
+    path = tmp_path / "bom.csv"
+    path.write_bytes("title,url,salary,description\nA,u1,1,d\nB,u2,2,d\n".encode("utf-8-sig"))
+    assert [v.title for v in load_csv(str(path), workers=1)] == ["A", "B"]
+    assert [v.title for v in load_csv(str(path), workers=2, min_size=0)] == ["A", "B"]
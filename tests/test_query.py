@@ -0,0 +1,143 @@
+from typing import List
+
+import pytest
+
+from src.query import (And, Currency, Domain, Keyword, Not, Or, Query,
+                       SalaryRange, VacancyIndex)
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def sample_vacancies() -> List[Vacancy]:
+    """
+    Фикстура, создающая список тестовых вакансий.
+    """
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 150000, "Опыт с Django и Flask"),
+        Vacancy("Junior Developer", "https://spb.hh.ru/vacancy/2", 80000, "Начинающий специалист"),
+        Vacancy("QA Engineer", "https://agency.com/qa", 90000, "Тестирование на Python", "USD"),
+        Vacancy("Data Scientist", "https://www.hh.ru/vacancy/4", 200000, "Опыт работы с ML и Python"),
+    ]
+
+
+def titles(vacancies) -> List[str]:
+    return [v.title for v in vacancies]
+
+
+def test_predicates_combine(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет комбинирование условий через AND/OR/NOT.
+    """
+    python = Keyword(["python"])
+    query = Query(where=python & SalaryRange(100000, 250000) & ~Currency("USD"))
+    assert titles(query.run(sample_vacancies)) == ["Data Scientist"]
+
+    query = Query(where=Or(Keyword(["junior"], fields=("title",)), Currency("usd")))
+    assert titles(query.run(sample_vacancies)) == ["Junior Developer", "QA Engineer"]
+
+    query = Query(where=Not(Domain("hh.ru")))
+    assert titles(query.run(sample_vacancies)) == ["QA Engineer"]
+
+
+def test_order_by_and_limit(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет сортировку по зарплате и ограничение количества.
+    """
+    query = Query(where=Domain("hh.ru"), order_by="salary", limit=2)
+    assert titles(query.run(sample_vacancies)) == ["Data Scientist", "Python Developer"]
+    query = Query(order_by="salary", descending=False, limit=1)
+    assert titles(query.run(sample_vacancies)) == ["Junior Developer"]
+
+
+def test_indexed_run_matches_full_scan(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что выполнение по индексу даёт тот же результат, что и полный проход.
+    """
+    index = VacancyIndex(sample_vacancies)
+    predicates = [
+        Keyword(["pyth"]) & Domain("hh.ru"),
+        Keyword(["и flask"]),
+        SalaryRange(85000) | Currency("USD"),
+        And(Keyword(["developer"], fields=("title",)), Not(SalaryRange(0, 100000))),
+        Currency("EUR"),
+    ]
+    for where in predicates:
+        for order_by in (None, "salary", "title"):
+            query = Query(where=where, order_by=order_by, limit=3)
+            assert titles(query.run_indexed(index)) == titles(query.run(sample_vacancies))
+
+
+def test_indexed_run_keeps_tie_order() -> None:
+    """
+    Проверяет, что при равных зарплатах индексный запрос сохраняет порядок добавления, как и полный проход.
+    """
+    vacancies = [Vacancy(f"V{i}", f"https://hh.ru/vacancy/{i}", 100000, "desc") for i in range(5)]
+    vacancies.append(Vacancy("Top", "https://hh.ru/vacancy/top", 200000, "desc"))
+    index = VacancyIndex(vacancies)
+    for descending in (True, False):
+        for where in (None, Domain("hh.ru"), Keyword(["top"], fields=("title",))):
+            query = Query(where=where, order_by="salary", descending=descending, limit=4)
+            assert titles(query.run_indexed(index)) == titles(query.run(vacancies))
+    query = Query(order_by="salary", limit=3)
+    assert titles(query.run_indexed(index)) == ["Top", "V0", "V1"]
+
+
+def test_and_candidates_use_most_selective(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что AND строит множество только для самого селективного индекса.
+    """
+    index = VacancyIndex(sample_vacancies)
+    built: List[str] = []
+
+    class Tracked(SalaryRange):
+        def candidates(self, index):
+            built.append("salary")
+            return super().candidates(index)
+
+    where = And(Tracked(0, 1000000), Currency("USD"))
+    assert where.estimate(index) == 1
+    assert where.candidates(index) == {2}
+    assert built == []
+    assert titles(Query(where=where, order_by="salary").run_indexed(index)) == ["QA Engineer"]
+
+
+def test_limit_stops_early() -> None:
+    """
+    Проверяет, что запрос с limit без сортировки не дочитывает источник.
+    """
+    consumed: List[int] = []
+
+    def source():
+        for i in range(100):
+            consumed.append(i)
+            yield Vacancy(f"Vacancy {i}", "url", i, "desc")
+
+    result = list(Query(where=SalaryRange(10), limit=2).run(source()))
+    assert titles(result) == ["Vacancy 10", "Vacancy 11"]
+    assert len(consumed) == 12
+
+
+def test_unknown_order_by() -> None:
+    """
+    Проверяет ошибку при неизвестном поле сортировки.
+    """
+    with pytest.raises(ValueError):
+        Query(order_by="unknown")
+
+
+def test_keyword_postings_scanned_once(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что словарь индекса сканируется один раз за планирование.
+    """
+    index = VacancyIndex(sample_vacancies)
+    scans: List[int] = []
+
+    class CountingDict(dict):
+        def items(self):
+            scans.append(1)
+            return super().items()
+
+    index.tokens["description"] = CountingDict(index.tokens["description"])
+    where = And(Keyword(["django"]), SalaryRange(0))
+    assert titles(Query(where=where).run_indexed(index)) == ["Python Developer"]
+    assert len(scans) == 1
@@ -1,10 +1,12 @@
+import io
 from typing import List
 
 import pytest
 
 from src.utils import (filter_vacancies, get_top_vacancies,
-                       get_vacancies_by_salary, print_vacancies,
-                       sort_vacancies)
+                       get_vacancies_by_salary, iter_filter_vacancies,
+                       iter_vacancies_by_salary, print_vacancies,
+                       print_vacancies_paged, sort_vacancies)
 from src.vacancy import Vacancy
 
 
@@ -89,3 +91,54 @@ def test_print_vacancies(capsys: pytest.CaptureFixture, sample_vacancies: List[V
     captured = capsys.readouterr()
     assert "Python Developer" in captured.out
     assert "Опыт с Django и Flask" in captured.out
+
+
+def test_iter_filters_are_lazy(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет, что генераторные фильтры компонуются и не потребляют источник заранее.
+    """
+    consumed: List[str] = []
+
+    def source():
+        for v in sample_vacancies:
+            consumed.append(v.title)
+            yield v
+
+    pipeline = iter_vacancies_by_salary(iter_filter_vacancies(source(), ["python"]), "100000-250000")
+    assert consumed == []
+    first = next(pipeline)
+    assert first.title == "Data Scientist"
+    assert consumed == [v.title for v in sample_vacancies]
+
+
+def test_print_vacancies_paged_pages_and_stop(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет постраничный вывод и остановку по ответу pause.
+    """
+    out = io.StringIO()
+    calls: List[int] = []
+
+    def pause() -> bool:
+        calls.append(1)
+        return False
+
+    printed = print_vacancies_paged(iter(sample_vacancies), page_size=3, stream=out, pause=pause)
+    assert printed == 3
+    assert len(calls) == 1
+    assert "Data Scientist" not in out.getvalue()
+
+
+def test_print_vacancies_paged_compact_and_truncate(sample_vacancies: List[Vacancy]) -> None:
+    """
+    Проверяет компактный табличный режим и обрезку описания.
+    """
+    out = io.StringIO()
+    printed = print_vacancies_paged(sample_vacancies, compact=True, stream=out)
+    assert printed == 4
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith(f"{'Зарплата':>10}")
+    assert len(lines) == 5
+
+    out = io.StringIO()
+    print_vacancies_paged(sample_vacancies[:1], max_description=10, stream=out)
+    assert "Описание: Опыт с Dj…" in out.getvalue()
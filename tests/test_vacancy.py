@@ -1,3 +1,4 @@
+import pickle
 from typing import Any, Dict, List
 
 from src.vacancy import Vacancy
@@ -50,6 +51,7 @@ def test_as_dict_returns_correct_dict() -> None:
     assert d["url"] == "url"
     assert d["salary"] == 50000
     assert d["description"] == "desc"
+    assert d["currency"] == "RUR"
 
 
 def test_cast_to_object_list_creates_vacancies() -> None:
@@ -60,8 +62,9 @@ def test_cast_to_object_list_creates_vacancies() -> None:
         {
             "name": "Dev",
             "alternate_url": "url1",
-            "salary": {"from": 100000},
-            "snippet": {"requirement": "req1"}
+            "salary": {"from": 100000, "currency": "usd"},
+            "snippet": {"requirement": "req1"},
+            "published_at": "2024-05-01T12:00:00+0300"
         },
         {
             "name": "QA",
@@ -75,6 +78,19 @@ def test_cast_to_object_list_creates_vacancies() -> None:
     assert vacancies[0].title == "Dev"
     assert vacancies[0].salary == 100000
     assert vacancies[0].description == "req1"
+    assert vacancies[0].currency == "USD"
+    assert vacancies[0].published is not None and vacancies[0].published.day == 1
     assert vacancies[1].title == "QA"
     assert vacancies[1].salary == 0  # зарплата не указана
     assert vacancies[1].description == "resp2"
+    assert vacancies[1].currency == "RUR"
+    assert vacancies[1].published is None
+
+
+def test_vacancy_pickle_roundtrip() -> None:
+    """
+    Проверяет, что вакансия сохраняет все поля при передаче через pickle.
+    """
+    vac = Vacancy("Dev", "url", 50000, "desc", "USD")
+    restored = pickle.loads(pickle.dumps(vac))
+    assert restored.as_dict() == vac.as_dict()